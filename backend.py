@@ -1,9 +1,10 @@
 #import username search function
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from heatmap.services.trends import get_country_search_density
 from username_tracker.routers.maigret_router import router as maigret_router
-from socialmediatracer.tikspyder_wrapper import fetch_tiktok_by_query
+from socialmediatracer.tikspyder_wrapper import fetch_tiktok_by_query_async
 from geminiagent.gemini_agent import analyze_title, _fallback_result
 from duckduckgo_search import DDGS
 
@@ -11,15 +12,34 @@ from pydantic import BaseModel, EmailStr
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import httpx
-import trio
+import orjson
 import importlib
 import pkgutil
 import re
 import asyncio
-from functools import partial
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from operator import itemgetter
 
 
-app = FastAPI()
+# Sized so a full 5-email batch (~120 checks per scan) doesn't queue on
+# the pool and surface httpx PoolTimeouts as rate-limit results
+HOLEHE_MAX_CONNECTIONS = 5 * 120
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One connection pool shared by every holehe check; each scan wraps it
+    # in its own client so cookie jars never leak between scans
+    app.state.httpx_transport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(max_connections=HOLEHE_MAX_CONNECTIONS, max_keepalive_connections=100),
+    )
+    yield
+    await app.state.httpx_transport.aclose()
+
+
+# orjson writes NaN/inf as null, so CSV-derived rows need no sanitizing pass
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.include_router(maigret_router)
 
 @app.get("/")
@@ -77,7 +97,7 @@ def search_keyword(keyword: str):
     }
 
 @app.get("/tiktok/search")
-def tiktok_search(
+async def tiktok_search(
     q: str = Query(..., description="Search query"),
     limit: int = Query(25, ge=1, le=200),
     use_apify: bool = Query(False, description="Use Apify to enrich results"),
@@ -87,7 +107,7 @@ def tiktok_search(
     (search_results + related_content from CSVs).
     """
     try:
-        data = fetch_tiktok_by_query(
+        data = await fetch_tiktok_by_query_async(
             query=q,
             use_apify=use_apify,
             number_of_results=limit,
@@ -106,6 +126,10 @@ Simple, production-ready implementation
 
 # Email validation regex
 EMAIL_FORMAT = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+_EMAIL_RE = re.compile(EMAIL_FORMAT)
+
+# Modules that trigger password recovery emails
+EXCLUDE_SET = frozenset(["adobe", "mail_ru", "odnoklassniki", "samsung"])
 
 # Domain mapping for services
 DOMAIN_MAP = {
@@ -153,7 +177,15 @@ class EmailCheckResponse(BaseModel):
     checked_at: str
 
 
+# Check functions per exclude_password_recovery flag, discovered once per process
+_WEBSITES_CACHE: Dict[bool, List] = {}
+
+# Serialized /api/supported-platforms body, built on first request
+_PLATFORMS_RESPONSE_BYTES: Optional[bytes] = None
+
+
 # Core Holehe Functions
+@lru_cache(maxsize=None)
 def import_holehe_modules(package_name: str = "holehe.modules"):
     """Import all holehe submodules"""
     try:
@@ -178,23 +210,37 @@ def import_holehe_modules(package_name: str = "holehe.modules"):
 def get_check_functions(modules: Dict, exclude_password_recovery: bool = True):
     """Extract check functions from modules"""
     websites = []
-    exclude_list = ["adobe", "mail_ru", "odnoklassniki", "samsung"]
     
     for module_name, module in modules.items():
-        if len(module_name.split(".")) > 3:
-            site = module_name.split(".")[-1]
-            if site in module.__dict__:
-                if exclude_password_recovery:
-                    if not any(excluded in str(module.__dict__[site]) for excluded in exclude_list):
-                        websites.append(module.__dict__[site])
-                else:
-                    websites.append(module.__dict__[site])
+        parts = module_name.split(".")
+        if len(parts) > 3:
+            site = parts[-1]
+            if site not in module.__dict__:
+                continue
+            if exclude_password_recovery and site in EXCLUDE_SET:
+                continue
+            websites.append(module.__dict__[site])
+    return websites
+
+
+def get_websites(exclude_password_recovery: bool = True):
+    """Return the cached list of check functions, discovering them on first use"""
+    websites = _WEBSITES_CACHE.get(exclude_password_recovery)
+    if websites is None:
+        websites = get_check_functions(import_holehe_modules(), exclude_password_recovery)
+        _WEBSITES_CACHE[exclude_password_recovery] = websites
     return websites
 
 
 def is_valid_email(email: str) -> bool:
     """Validate email format"""
-    return bool(re.fullmatch(EMAIL_FORMAT, email))
+    # Cheap structural checks reject most bad input before the regex runs
+    return (
+        '@' in email
+        and '.' in email
+        and len(email) <= 254
+        and _EMAIL_RE.fullmatch(email) is not None
+    )
 
 
 async def launch_module_check(module, email: str, client: httpx.AsyncClient, results: List):
@@ -202,7 +248,7 @@ async def launch_module_check(module, email: str, client: httpx.AsyncClient, res
     try:
         await module(email, client, results)
     except Exception as e:
-        name = str(module).split('<function ')[1].split(' ')[0] if '<function' in str(module) else 'unknown'
+        name = getattr(module, '__name__', 'unknown')
         domain = DOMAIN_MAP.get(name, "unknown")
         results.append({
             "name": name,
@@ -216,62 +262,58 @@ async def launch_module_check(module, email: str, client: httpx.AsyncClient, res
         })
 
 
-async def check_email_trio(email: str, exclude_password_recovery: bool = True, timeout: int = 15):
-    """Main function to check email across all platforms using Trio"""
+async def check_email_asyncio(email: str, transport: httpx.AsyncHTTPTransport, exclude_password_recovery: bool = True):
+    """Main function to check email across all platforms"""
     if not is_valid_email(email):
         raise ValueError(f"Invalid email format: {email}")
     
-    # Import modules
-    modules = import_holehe_modules()
-    websites = get_check_functions(modules, exclude_password_recovery)
+    websites = get_websites(exclude_password_recovery)
     
     results = []
     
+    # Fresh cookie jar per scan over the shared pool. Not closed here:
+    # closing the client would also close the shared transport.
+    client = httpx.AsyncClient(transport=transport, timeout=15)
+    
     # Run checks
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        async with trio.open_nursery() as nursery:
-            for website in websites:
-                nursery.start_soon(launch_module_check, website, email, client, results)
+    async with asyncio.TaskGroup() as tg:
+        for website in websites:
+            tg.create_task(launch_module_check(website, email, client, results))
     
     # Sort results
-    results.sort(key=lambda x: x.get('name', ''))
+    # Every module result and the error path set 'name'
+    results.sort(key=itemgetter('name'))
     return results
 
 
-async def check_email_on_platforms(email: str, exclude_password_recovery: bool = True, timeout: int = 15):
-    """Wrapper to run Trio code from asyncio"""
-    # Run the trio coroutine in a thread pool to avoid event loop conflicts
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        None,
-        partial(trio.run, check_email_trio, email, exclude_password_recovery, timeout)
-    )
-
-
 def format_results(raw_results: List[Dict], email: str, only_found: bool = False):
     """Format raw results into API response"""
-    platforms_found = []
-    detailed_results = []
+    platforms_found = [
+        result.get('domain', 'unknown')
+        for result in raw_results
+        if result.get('exists')
+    ]
+    detailed_results = None
     
-    for result in raw_results:
-        if result.get('exists'):
-            platform_name = result.get('domain', 'unknown')
-            platforms_found.append(platform_name)
-            
-            detailed_results.append(PlatformInfo(
-                platform=platform_name,
-                name=result.get('name', ''),
-                exists=True,
-                email_recovery=result.get('emailrecovery'),
-                phone_number=result.get('phoneNumber'),
-                additional_info=result.get('others')
-            ))
-        elif not only_found:
-            detailed_results.append(PlatformInfo(
-                platform=result.get('domain', 'unknown'),
-                name=result.get('name', ''),
-                exists=False
-            ))
+    if not only_found:
+        # Results come straight from holehe, so skip per-row validation
+        detailed_results = []
+        for result in raw_results:
+            if result.get('exists'):
+                detailed_results.append(PlatformInfo.model_construct(
+                    platform=result.get('domain', 'unknown'),
+                    name=result.get('name', ''),
+                    exists=True,
+                    email_recovery=result.get('emailrecovery'),
+                    phone_number=result.get('phoneNumber'),
+                    additional_info=result.get('others')
+                ))
+            else:
+                detailed_results.append(PlatformInfo.model_construct(
+                    platform=result.get('domain', 'unknown'),
+                    name=result.get('name', ''),
+                    exists=False
+                ))
     
     return EmailCheckResponse(
         success=True,
@@ -279,7 +321,7 @@ def format_results(raw_results: List[Dict], email: str, only_found: bool = False
         total_checked=len(raw_results),
         found_count=len(platforms_found),
         platforms_found=platforms_found,
-        detailed_results=detailed_results if not only_found else None,
+        detailed_results=detailed_results,
         checked_at=datetime.utcnow().isoformat()
     )
 
@@ -309,8 +351,9 @@ async def check_email_post(request: EmailCheckRequest):
     """
     try:
         # Run the check
-        raw_results = await check_email_on_platforms(
+        raw_results = await check_email_asyncio(
             email=request.email,
+            transport=app.state.httpx_transport,
             exclude_password_recovery=request.exclude_password_recovery
         )
         
@@ -355,7 +398,7 @@ async def check_email_get(
             raise HTTPException(status_code=400, detail="Invalid email format")
         
         # Run the check
-        raw_results = await check_email_on_platforms(email=email)
+        raw_results = await check_email_asyncio(email=email, transport=app.state.httpx_transport)
         
         # Get only platforms where email exists
         platforms_found = [
@@ -395,27 +438,33 @@ async def batch_check_emails(emails: List[EmailStr]):
     
     results = {}
     
-    for email in emails:
-        try:
-            raw_results = await check_email_on_platforms(email=email)
-            platforms_found = [
-                r.get('domain', 'unknown') 
-                for r in raw_results 
-                if r.get('exists', False)
-            ]
-            
-            results[email] = {
-                "success": True,
-                "platforms_found": platforms_found,
-                "count": len(platforms_found)
-            }
-        except Exception as e:
+    # Scans are network-bound, so run them side by side over the shared pool
+    raw = await asyncio.gather(
+        *(check_email_asyncio(email=email, transport=app.state.httpx_transport) for email in emails),
+        return_exceptions=True
+    )
+    
+    for email, raw_results in zip(emails, raw):
+        if isinstance(raw_results, Exception):
             results[email] = {
                 "success": False,
-                "error": str(e),
+                "error": str(raw_results),
                 "platforms_found": [],
                 "count": 0
             }
+            continue
+        
+        platforms_found = [
+            r.get('domain', 'unknown') 
+            for r in raw_results 
+            if r.get('exists', False)
+        ]
+        
+        results[email] = {
+            "success": True,
+            "platforms_found": platforms_found,
+            "count": len(platforms_found)
+        }
     
     return {
         "success": True,
@@ -432,24 +481,27 @@ async def get_supported_platforms():
     
     Returns a list of all platforms that can be checked.
     """
-    try:
-        modules = import_holehe_modules()
-        websites = get_check_functions(modules)
-        
-        platform_names = []
-        for website in websites:
-            name = str(website).split('<function ')[1].split(' ')[0] if '<function' in str(website) else 'unknown'
-            domain = DOMAIN_MAP.get(name, name)
-            if domain not in platform_names:
-                platform_names.append(domain)
-        
-        return {
-            "success": True,
-            "total_platforms": len(platform_names),
-            "platforms": sorted(platform_names)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error loading platforms: {str(e)}")
+    global _PLATFORMS_RESPONSE_BYTES
+    if _PLATFORMS_RESPONSE_BYTES is None:
+        try:
+            websites = get_websites()
+            
+            platform_names = []
+            for website in websites:
+                name = getattr(website, '__name__', 'unknown')
+                domain = DOMAIN_MAP.get(name, name)
+                if domain not in platform_names:
+                    platform_names.append(domain)
+            
+            _PLATFORMS_RESPONSE_BYTES = orjson.dumps({
+                "success": True,
+                "total_platforms": len(platform_names),
+                "platforms": sorted(platform_names)
+            })
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error loading platforms: {str(e)}")
+    
+    return Response(content=_PLATFORMS_RESPONSE_BYTES, media_type="application/json")
     
 
 #gemini endpoint
@@ -1,5 +1,6 @@
 import os
-import json
+import re
+import orjson
 from dotenv import load_dotenv
 from google import genai
 
@@ -14,8 +15,11 @@ client = genai.Client(api_key=API_KEY)
 
 MODEL_NAME = "gemini-2.5-flash"  # or gemini-2.0-flash / gemini-2.5-flash if enabled
 
+# First "{" through last "}" of a model reply that has extra text around the JSON
+_JSON_OBJ_RE = re.compile(r"\{.*\}", re.S)
 
-PROMPT_TEMPLATE = """
+
+_PROMPT_PREFIX = """
 You are a cybersecurity and online safety analyst.
 
 You will receive metadata about a single social media post and you must ONLY evaluate
@@ -43,24 +47,31 @@ OUTPUT FORMAT (VERY IMPORTANT):
 Return ONLY valid JSON and NOTHING else.
 
 The JSON MUST have these exact keys:
-{{
+{
   "record_id": <integer>,
   "title": "<original title>",
   "verdict": "<good | bad>",
   "threat_score": <integer 0-100>,
   "reason": "<short explanation in one or two sentences>"
-}}
+}
 
 Here is the post data:
 
-record_id: {record_id}
-source   : {source}
-author   : {author}
-title    : {title}
-link     : {link}
 """
 
 
+def _build_prompt(record_id, source, author, title, link) -> str:
+    # Static prefix is built once; only the record fields are filled per call
+    return (
+        f"{_PROMPT_PREFIX}"
+        f"record_id: {record_id}\n"
+        f"source   : {source}\n"
+        f"author   : {author}\n"
+        f"title    : {title}\n"
+        f"link     : {link}\n"
+    )
+
+
 def analyze_title(record: dict) -> dict:
     """
     Analyze a single post record (like the TikTok objects you showed)
@@ -73,13 +84,7 @@ def analyze_title(record: dict) -> dict:
     title = record.get("title", "")
     link = record.get("link", "")
 
-    prompt = PROMPT_TEMPLATE.format(
-        record_id=record_id,
-        source=source,
-        author=author,
-        title=title,
-        link=link,
-    )
+    prompt = _build_prompt(record_id, source, author, title, link)
 
     # Call Gemini
     response = client.models.generate_content(
@@ -91,15 +96,14 @@ def analyze_title(record: dict) -> dict:
 
     # Parse JSON safely
     try:
-        result = json.loads(raw_text)
-    except json.JSONDecodeError:
+        result = orjson.loads(raw_text)
+    except orjson.JSONDecodeError:
         # Try to salvage a JSON block if model added something extra
-        start = raw_text.find("{")
-        end = raw_text.rfind("}")
-        if start != -1 and end != -1:
+        match = _JSON_OBJ_RE.search(raw_text)
+        if match:
             try:
-                result = json.loads(raw_text[start:end+1])
-            except Exception:
+                result = orjson.loads(match.group(0))
+            except orjson.JSONDecodeError:
                 result = _fallback_result(record_id, title, raw_text)
         else:
             result = _fallback_result(record_id, title, raw_text)
@@ -1,7 +1,9 @@
 from heatmap.utils.normalize import normalize_scores
-import random
-import json
+import numpy as np
+import orjson
 import os
+import zlib
+from functools import lru_cache
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -10,17 +12,28 @@ TOPOJSON_PATH = os.path.abspath(TOPOJSON_PATH)
 
 print("Loading countries from:", TOPOJSON_PATH)
 
-with open(TOPOJSON_PATH, "r", encoding="utf-8") as f:
-    topo = json.load(f)
+def _load_country_names(path):
+    # Only the names are needed; the parsed TopoJSON is dropped on return
+    with open(path, "rb") as f:
+        topo = orjson.loads(f.read())
 
-# Extract countries from TopoJSON
-geometries = topo["objects"]["countries"]["geometries"]
+    # Extract countries from TopoJSON
+    geometries = topo["objects"]["countries"]["geometries"]
+    return tuple(g["properties"]["name"] for g in geometries)
 
-COUNTRY_NAMES = [
-    g["properties"]["name"] for g in geometries
-]
+COUNTRY_NAMES = _load_country_names(TOPOJSON_PATH)
+
+@lru_cache(maxsize=4096)
+def _cached_country_search_density(keyword: str):
+    rng = np.random.default_rng(zlib.crc32(keyword.encode("utf-8")))  # same keyword -> same scores
+    scores = rng.integers(0, 101, size=len(COUNTRY_NAMES)).tolist()
+    result = [{"country": name, "score": score} for name, score in zip(COUNTRY_NAMES, scores)]
+    # Cache immutable (country, score) pairs so callers can't corrupt them
+    return tuple((item["country"], item["score"]) for item in normalize_scores(result))
 
 def get_country_search_density(keyword: str):
-    random.seed(keyword)  # same keyword -> same scores
-    result = [{"country": name, "score": random.randint(0, 100)} for name in COUNTRY_NAMES]
-    return normalize_scores(result)
+    # Output is a pure function of keyword, so repeat searches hit the cache
+    return [
+        {"country": country, "score": score}
+        for country, score in _cached_country_search_density(keyword)
+    ]
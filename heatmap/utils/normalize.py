@@ -1,11 +1,14 @@
+import numpy as np
+
+
 def normalize_scores(data, value_key="score"):
     if not data:
         return data
 
-    values = [item[value_key] for item in data]
+    values = np.fromiter((item[value_key] for item in data), dtype=np.float64, count=len(data))
 
-    minimum_value = min(values)
-    maximum_value = max(values)
+    minimum_value = values.min()
+    maximum_value = values.max()
 
     if minimum_value == maximum_value:
         return [
@@ -13,9 +16,10 @@ def normalize_scores(data, value_key="score"):
             for item in data
         ]
 
-    normalized = []
-    for item in data:
-        normalized_value = int((item[value_key] - minimum_value) / (maximum_value - minimum_value) * 100)
-        normalized.append({**item, value_key: normalized_value})
-    
-    return normalized
+    # Same truncation as int() on each scaled value, done in one array pass
+    normalized = ((values - minimum_value) / (maximum_value - minimum_value) * 100).astype(np.int64)
+
+    return [
+        {**item, value_key: int(normalized_value)}
+        for item, normalized_value in zip(data, normalized.tolist())
+    ]
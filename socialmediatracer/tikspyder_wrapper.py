@@ -2,10 +2,11 @@
 import asyncio
 import os
 import time
-import glob
-import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-import pandas as pd  # or use csv module if you don't want pandas
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 from socialmediatracer.utils import (
     get_config_attrs,
@@ -15,35 +16,29 @@ from socialmediatracer.utils import (
 )
 from socialmediatracer.data_collectors import TikTokDataCollector
 
-def _ensure_event_loop():
+def _init_loop_for_thread():
     """
-    Ensure the current thread has an asyncio event loop.
+    Give each worker thread one long-lived asyncio event loop.
     Maigret/TikSpyder internally calls asyncio.get_event_loop(),
     which on Python 3.11+ raises if no loop is set in this thread.
     """
-    try:
-        # If there is a running loop, we’re fine
-        asyncio.get_running_loop()
-    except RuntimeError:
-        # No loop in this thread → create and set one
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-def _json_safe(obj):
-    """
-    Recursively replace NaN/inf with None so json.dumps won't crash.
-    """
-    if isinstance(obj, float):
-        if math.isnan(obj) or math.isinf(obj):
-            return None
-        return obj
-    if isinstance(obj, dict):
-        return {k: _json_safe(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_json_safe(x) for x in obj]
-    return obj
-
-def fetch_tiktok_by_query(
+    asyncio.set_event_loop(asyncio.new_event_loop())
+
+# Match the old pandas output: empty cells are null in every column, and
+# apify's ISO timestamps stay strings instead of being parsed to datetimes
+_CSV_CONVERT_OPTIONS = pacsv.ConvertOptions(
+    strings_can_be_null=True,
+    column_types={"create_time_iso": pa.string()},
+)
+
+# Persistent workers for the blocking collector runs
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=4,
+    thread_name_prefix="tikspyder",
+    initializer=_init_loop_for_thread,
+)
+
+def _fetch_tiktok_by_query(
     query: str,
     *,
     use_apify: bool = False,
@@ -55,8 +50,8 @@ def fetch_tiktok_by_query(
     """
     Run TikSpyder for a keyword search and return all rows from the
     generated CSVs as a list of dicts.
+    Must run on _EXECUTOR, whose threads have the event loop TikSpyder expects.
     """
-    _ensure_event_loop()
     # Locate project root and config directory
     project_root = get_project_root()
     config_dir = os.path.join(project_root, "config")
@@ -121,11 +116,27 @@ def fetch_tiktok_by_query(
     collector.generate_data_files()
 
     # Collect all CSV rows into a single list of dicts
-    csv_files = glob.glob(os.path.join(output_dir, "*.csv"))
+    with os.scandir(output_dir) as entries:
+        csv_files = [
+            entry.path for entry in entries
+            if entry.name.endswith(".csv") and entry.is_file()
+        ]
     all_rows: list[dict] = []
 
     for path in csv_files:
-        df = pd.read_csv(path)
-        all_rows.extend(df.to_dict("records"))
+        table = pacsv.read_csv(path, convert_options=_CSV_CONVERT_OPTIONS)
+        all_rows.extend(table.to_pylist())
+
+    return all_rows
+
 
-    return _json_safe(all_rows)
+async def fetch_tiktok_by_query_async(query: str, **kwargs) -> list[dict]:
+    """
+    Run TikSpyder for a keyword search on the worker pool without
+    blocking the caller's event loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _EXECUTOR,
+        partial(_fetch_tiktok_by_query, query, **kwargs),
+    )
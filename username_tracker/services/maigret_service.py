@@ -1,7 +1,9 @@
 # services/maigret_service.py
 import logging
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 import maigret
 from maigret.sites import MaigretDatabase
@@ -15,25 +17,48 @@ MAIGRET_DB_FILE = (
     Path(maigret.__file__).resolve().parent / "resources" / "data.json"
 )
 
-def _load_sites(
-    top_sites: int,
-    tags: Optional[List[str]] = None,
-    site_list: Optional[List[str]] = None,
-) -> Dict[str, Any]:
-    """Load Maigret sites DB and filter by top/tags/site_list."""
-    db = MaigretDatabase().load_from_path(str(MAIGRET_DB_FILE))
+_DB: Optional[MaigretDatabase] = None
+_DB_LOCK = threading.Lock()
 
-    tags = tags or []
-    site_list = site_list or []
 
-    sites = db.ranked_sites_dict(
+def _get_db() -> MaigretDatabase:
+    """Load Maigret sites DB once per process."""
+    global _DB
+    if _DB is None:
+        with _DB_LOCK:
+            if _DB is None:
+                _DB = MaigretDatabase().load_from_path(str(MAIGRET_DB_FILE))
+    return _DB
+
+
+@lru_cache(maxsize=128)
+def _ranked_sites(
+    top_sites: int,
+    tags: Tuple[str, ...],
+    site_list: Tuple[str, ...],
+) -> Dict[str, Any]:
+    return _get_db().ranked_sites_dict(
         top=top_sites,
-        tags=tags,
-        names=site_list,
+        tags=list(tags),
+        names=list(site_list),
         disabled=False,
         id_type="username",
     )
-    return sites
+
+
+def _load_sites(
+    top_sites: int,
+    tags: Optional[List[str]] = None,
+    site_list: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Filter the cached Maigret sites DB by top/tags/site_list."""
+    sites = _ranked_sites(
+        top_sites,
+        tuple(sorted(tags or [])),
+        tuple(sorted(site_list or [])),
+    )
+    # Hand out a copy so callers can't mutate the cached dict
+    return dict(sites)
 
 
 async def maigret_search_username(